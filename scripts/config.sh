@@ -80,7 +80,7 @@ declare -A DIRECTORIES=(
 # Python packages to install (as arrays for proper handling)
 BASE_PACKAGES=(pyyaml pillow numpy requests)
 # Core packages needed for ComfyUI v0.4.0+
-ADDITIONAL_PACKAGES=(spandrel av GitPython toml rich safetensors pydantic pydantic-settings alembic)
+ADDITIONAL_PACKAGES=(spandrel av GitPython toml rich safetensors pydantic pydantic-settings alembic orjson)
 
 # PyTorch installation will be determined dynamically based on GPU availability
 # This is set in install.sh based on platform detection
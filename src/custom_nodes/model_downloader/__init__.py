@@ -3,15 +3,12 @@
 
 from __future__ import annotations
 
-import importlib.util
 import logging
 import os
-import sys
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
-if TYPE_CHECKING:
-    from aiohttp import web
+from aiohttp import web
 
 # Setup logging
 logger = logging.getLogger("model_downloader")
@@ -27,34 +24,24 @@ WEB_DIRECTORY = os.path.join(os.path.dirname(os.path.realpath(__file__)), "js")
 if not os.path.exists(WEB_DIRECTORY):
     os.makedirs(WEB_DIRECTORY, exist_ok=True)
 
-# Add the current directory to the path to ensure we can import our modules
-current_dir = os.path.dirname(os.path.realpath(__file__))
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
-
 # Type aliases for handler functions
-DownloadHandler = Callable[["web.Request"], "web.Response"]
+DownloadHandler = Callable[[web.Request], web.Response]
 
 # Import the model_downloader_patch module and get handler functions
 _download_model_handler: DownloadHandler | None = None
 _get_download_progress_handler: DownloadHandler | None = None
 _list_downloads_handler: DownloadHandler | None = None
+_close_session_handler: Callable[[Any], Any] | None = None
 
 try:
-    spec = importlib.util.spec_from_file_location(
-        "model_downloader_patch", os.path.join(current_dir, "model_downloader_patch.py")
-    )
-    if spec is None or spec.loader is None:
-        msg = "Failed to load model_downloader_patch module"
-        raise ImportError(msg)
-
-    model_downloader_patch = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(model_downloader_patch)
+    # A regular package import, so every importer shares one copy of the module
+    from . import model_downloader_patch
 
     # Get the handler functions
     _download_model_handler = model_downloader_patch.download_model
     _get_download_progress_handler = model_downloader_patch.get_download_progress
     _list_downloads_handler = model_downloader_patch.list_downloads
+    _close_session_handler = model_downloader_patch.close_session
 
     logger.info("Successfully imported model downloader module")
 except ImportError:
@@ -65,7 +52,6 @@ async def download_model(request: Any) -> Any:
     """Download model handler - delegates to loaded module or returns error."""
     if _download_model_handler is not None:
         return await _download_model_handler(request)
-    from aiohttp import web
     return web.json_response({"success": False, "error": "Model downloader not available"})
 
 
@@ -73,7 +59,6 @@ async def get_download_progress(request: Any) -> Any:
     """Get download progress handler - delegates to loaded module or returns error."""
     if _get_download_progress_handler is not None:
         return await _get_download_progress_handler(request)
-    from aiohttp import web
     return web.json_response({"success": False, "error": "Model downloader not available"})
 
 
@@ -81,7 +66,6 @@ async def list_downloads(request: Any) -> Any:
     """List downloads handler - delegates to loaded module or returns error."""
     if _list_downloads_handler is not None:
         return await _list_downloads_handler(request)
-    from aiohttp import web
     return web.json_response({"success": False, "error": "Model downloader not available"})
 
 
@@ -97,32 +81,27 @@ def setup_js_api(app: Any, *args: Any, **kwargs: Any) -> Any:
     Returns:
         The modified app instance.
     """
-    try:
-        from aiohttp import web
-    except ImportError:
-        logger.exception("Error importing web from aiohttp")
-        return app
-
     logger.info("Registering model downloader API endpoints")
 
-    # Define route patterns to check for
-    route_patterns = ["/api/download-model", "/api/download-progress/", "/api/downloads"]
+    # Collect the paths of already registered routes in a single pass
+    registered_paths = {
+        route.resource.canonical for route in app.router.routes() if route.resource is not None
+    }
 
     # Check if any of our routes already exist
+    route_paths = ("/api/download-model", "/api/download-progress/{download_id}", "/api/downloads")
     existing_routes: set[str] = set()
-    for route in app.router.routes():
-        route_str = str(route)
-        for pattern in route_patterns:
-            if pattern in route_str:
-                existing_routes.add(pattern)
-                logger.info("Found existing route matching %s", pattern)
+    for path in route_paths:
+        if path in registered_paths:
+            existing_routes.add(path)
+            logger.info("Found existing route matching %s", path)
 
     # Register each endpoint if it doesn't already exist
     if "/api/download-model" not in existing_routes:
         app.router.add_post("/api/download-model", download_model)
         logger.info("Registered /api/download-model endpoint")
 
-    if "/api/download-progress/" not in existing_routes:
+    if "/api/download-progress/{download_id}" not in existing_routes:
         app.router.add_get("/api/download-progress/{download_id}", get_download_progress)
         logger.info("Registered /api/download-progress endpoint")
 
@@ -130,6 +109,10 @@ def setup_js_api(app: Any, *args: Any, **kwargs: Any) -> Any:
         app.router.add_get("/api/downloads", list_downloads)
         logger.info("Registered /api/downloads endpoint")
 
+    # Close the shared download session on shutdown
+    if _close_session_handler is not None and _close_session_handler not in app.on_cleanup:
+        app.on_cleanup.append(_close_session_handler)
+
     logger.info("Model downloader API endpoints registered successfully")
     return app
 
@@ -178,6 +178,31 @@
       console.error('[MODEL_DOWNLOADER] Error handling message event:', error);
     }
   }
+
+  // Handle batched progress messages that carry every in-progress download at once
+  function handleBatchMessageEvent(event) {
+    try {
+      // Unwrap the same message formats as handleMessageEvent
+      let messageData = event.data || event;
+
+      if (messageData && messageData.type === 'model_downloads_progress' && messageData.data) {
+        messageData = messageData.data;
+      }
+
+      if (messageData && messageData.detail) {
+        messageData = messageData.detail.data || messageData.detail;
+      }
+
+      if (messageData && messageData.downloads) {
+        // Each entry has the same shape as a single model_download_progress message
+        Object.values(messageData.downloads).forEach(download => {
+          handleMessageEvent(download);
+        });
+      }
+    } catch (error) {
+      console.error('[MODEL_DOWNLOADER] Error handling batch message event:', error);
+    }
+  }
   
   // Check if all active downloads are complete and close the dialog if appropriate
   function checkAndCloseDialog() {
@@ -846,6 +871,7 @@ function patchMissingModelButtons() {
     updateButtonStatus: updateButtonStatus,
     // registerMessageHandlers removed - now in model_downloader.js
     handleMessageEvent: handleMessageEvent,
+    handleBatchMessageEvent: handleBatchMessageEvent,
     checkAndCloseDialog: checkAndCloseDialog
   };
   
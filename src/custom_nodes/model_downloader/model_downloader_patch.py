@@ -3,17 +3,25 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, TypedDict
+from urllib.parse import parse_qs
 
 import folder_paths  # type: ignore[import-not-found]
-from aiohttp import ClientSession, ClientTimeout, web
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector, web
 from server import PromptServer  # type: ignore[import-not-found]
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from aiohttp import ClientResponse
 
@@ -25,15 +33,12 @@ logger = logging.getLogger("model_downloader")
 
 
 class DownloadInfo(TypedDict):
-    """Type definition for download information."""
+    """Type definition for download information stored in active_downloads."""
 
     url: str
     folder: str
     filename: str
     path: str
-    total_size: int
-    downloaded: int
-    percent: int
     status: str
     error: str | None
     start_time: float
@@ -41,10 +46,18 @@ class DownloadInfo(TypedDict):
 
 
 class DownloadInfoOptional(TypedDict, total=False):
-    """Optional fields for download information."""
+    """Optional fields for download information stored in active_downloads."""
 
     end_time: float
     content_type: str
+
+
+class DownloadProgress(TypedDict):
+    """Progress fields merged into download information by _download_snapshot."""
+
+    total_size: int
+    downloaded: int
+    percent: int
     speed: float
     eta: int
 
@@ -52,9 +65,80 @@ class DownloadInfoOptional(TypedDict, total=False):
 # Combined type for active downloads (all fields)
 DownloadData = dict[str, Any]  # Using Any for flexibility with TypedDict limitations
 
-# Store active downloads with their progress information
+
+class _Counters:
+    """Progress counters for a single download, updated from the transfer loop."""
+
+    __slots__ = ("downloaded", "eta", "percent", "speed", "total_size")
+
+    def __init__(self) -> None:
+        self.downloaded: int = 0
+        self.total_size: int = 0
+        self.percent: int = 0
+        self.speed: float = 0.0
+        self.eta: int = 0
+
+
+# Store active downloads with their metadata and status
 active_downloads: dict[str, DownloadData] = {}
 
+# Progress counters for active downloads, merged into snapshots on demand
+active_counters: dict[str, _Counters] = {}
+
+# Bounds for the transfer block size, tuned to the destination filesystem
+MIN_TRANSFER_BLOCK = 4 * 1024 * 1024
+MAX_TRANSFER_BLOCK = 16 * 1024 * 1024
+
+# Reciprocal of a mebibyte, so progress samples multiply instead of divide
+MB_PER_BYTE = 1.0 / (1024 * 1024)
+
+# Seconds between progress samples taken from the transfer loop
+PROGRESS_SAMPLE_INTERVAL = 0.25
+
+# Seconds between batched progress broadcasts to WebSocket clients
+PROGRESS_BROADCAST_INTERVAL = 1.0
+
+# Seconds finished downloads stay listed for frontend visibility
+FINISHED_DOWNLOAD_TTL = 60.0
+
+# Seconds a serialized download list may be reused for polling clients
+LIST_CACHE_TTL = 0.25
+
+# Suffix for in-progress downloads, renamed into place once complete
+PARTIAL_SUFFIX = ".partial"
+
+# Attempts per download; interrupted transfers resume from the partial file
+MAX_DOWNLOAD_ATTEMPTS = 3
+RETRY_DELAY = 2.0
+
+
+class _DownloaderState:
+    """Module-level state holder for the model downloader."""
+
+    def __init__(self) -> None:
+        self.session: ClientSession | None = None
+        self.broadcaster: asyncio.Task[None] | None = None
+        # (time.monotonic() when built, JSON body) for list_downloads
+        self.list_cache: tuple[float, bytes] | None = None
+        # Partial files owned by downloads running in this process
+        self.partial_paths: set[str] = set()
+
+
+# Single instance for module state
+_state = _DownloaderState()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_response(data: Any) -> web.Response:
+    """Create a JSON response serialized with _dumps."""
+    return web.Response(body=_dumps(data), content_type="application/json")
+
 
 async def download_model(request: web.Request) -> web.Response:
     """
@@ -84,14 +168,14 @@ async def download_model(request: web.Request) -> web.Response:
                 folder,
                 filename,
             )
-            return web.json_response({"success": False, "error": "Missing required parameters"})
+            return _json_response({"success": False, "error": "Missing required parameters"})
 
         # Get the model folder path
         folder_path = folder_paths.get_folder_paths(folder)
 
         if not folder_path:
             logger.error("Invalid folder: %s", folder)
-            return web.json_response({"success": False, "error": f"Invalid folder: {folder}"})
+            return _json_response({"success": False, "error": f"Invalid folder: {folder}"})
 
         # Create the full path for the file
         full_path = os.path.join(folder_path[0], filename)
@@ -107,20 +191,20 @@ async def download_model(request: web.Request) -> web.Response:
             "folder": folder,
             "filename": filename,
             "path": full_path,
-            "total_size": 0,
-            "downloaded": 0,
-            "percent": 0,
             "status": "downloading",
             "error": None,
             "start_time": time.time(),
             "download_id": download_id,
         }
+        active_counters[download_id] = _Counters()
+        _state.list_cache = None
 
         # Start the download as a separate task (don't await)
         PromptServer.instance.loop.create_task(_start_download(download_id, url, full_path))
+        _ensure_broadcaster()
 
         logger.info("Download %s queued, returning immediately to client", download_id)
-        return web.json_response(
+        return _json_response(
             {
                 "success": True,
                 "download_id": download_id,
@@ -131,10 +215,10 @@ async def download_model(request: web.Request) -> web.Response:
 
     except json.JSONDecodeError:
         logger.exception("Invalid JSON in request")
-        return web.json_response({"success": False, "error": "Invalid JSON"})
+        return _json_response({"success": False, "error": "Invalid JSON"})
     except (KeyError, TypeError) as e:
         logger.exception("Error processing download request")
-        return web.json_response({"success": False, "error": str(e)})
+        return _json_response({"success": False, "error": str(e)})
 
 
 async def _parse_request_data(request: web.Request) -> dict[str, Any]:
@@ -149,23 +233,22 @@ async def _parse_request_data(request: web.Request) -> dict[str, Any]:
         data = dict(form_data)
     else:
         body = await request.text()
-        logger.info("Request body: %s...", body[:200])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request body: %s...", body[:200])
 
         if request.query:
-            for key, value in request.query.items():
-                data[key] = value
+            data = dict(request.query)
 
         if not data and body:
             try:
                 data = json.loads(body)
             except json.JSONDecodeError:
-                for param in body.split("&"):
-                    if "=" in param:
-                        key, value = param.split("=", 1)
-                        data[key] = value
+                # Fall back to a URL-encoded form body
+                form = parse_qs(body, keep_blank_values=True)
+                data = {key: values[0] for key, values in form.items()}
 
-    logger.info("Request headers: %s", request.headers)
-    logger.info("Parsed data: %s", data)
+    logger.debug("Request headers: %s", request.headers)
+    logger.debug("Parsed data: %s", data)
 
     return data
 
@@ -179,6 +262,8 @@ async def _start_download(download_id: str, url: str, full_path: str) -> None:
         if download_id in active_downloads:
             active_downloads[download_id]["status"] = "error"
             active_downloads[download_id]["error"] = str(e)
+            active_downloads[download_id]["end_time"] = time.time()
+            _state.list_cache = None
             await send_download_update(download_id)
 
 
@@ -193,158 +278,341 @@ async def download_file(download_id: str, url: str, full_path: str) -> None:
         url: URL to download from.
         full_path: Local path to save the file.
     """
+    partial_path: str | None = None
     try:
         logger.info("Starting download task for %s from %s to %s", download_id, url, full_path)
 
         # Prepare destination directory
-        prepared_path = await _prepare_download_path(download_id, full_path)
-        if prepared_path is None:
+        partial_path = await _prepare_download_path(download_id, full_path)
+        if partial_path is None:
             return
 
-        # Create ClientTimeout with reasonable values
-        timeout = ClientTimeout(total=None, connect=30, sock_connect=30, sock_read=30)
-
-        async with ClientSession(timeout=timeout) as session:
-            # Get file size via HEAD request
-            await _fetch_content_length(session, download_id, url)
-
-            # Download the file
-            await _download_with_progress(session, download_id, url, prepared_path)
-
-        # Keep download info for 60 seconds for frontend visibility
-        await asyncio.sleep(60)
-        active_downloads.pop(download_id, None)
+        # Download the file, resuming after transient network errors. Only bytes
+        # this call wrote are resumed; the first attempt always starts from scratch.
+        for attempt in range(1, MAX_DOWNLOAD_ATTEMPTS + 1):
+            resume_from = _partial_size(partial_path) if attempt > 1 else 0
+            try:
+                await _download_with_progress(
+                    download_id, url, partial_path, full_path, resume_from
+                )
+                break
+            except (ClientError, TimeoutError) as e:
+                if attempt == MAX_DOWNLOAD_ATTEMPTS:
+                    raise
+                logger.warning(
+                    "[%s] Download interrupted (%s), resuming (attempt %d of %d)",
+                    download_id,
+                    e,
+                    attempt + 1,
+                    MAX_DOWNLOAD_ATTEMPTS,
+                )
+                await asyncio.sleep(RETRY_DELAY * attempt)
 
-    except (OSError, TimeoutError):
+    except (OSError, TimeoutError, ClientError):
         logger.exception("Error downloading file")
         if download_id in active_downloads:
             active_downloads[download_id]["status"] = "error"
             active_downloads[download_id]["error"] = "Download failed"
             active_downloads[download_id]["end_time"] = time.time()
+            _state.list_cache = None
             await send_download_update(download_id)
+    finally:
+        # A completed download has already been renamed into place
+        if partial_path is not None:
+            _state.partial_paths.discard(partial_path)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(partial_path)
+
+
+def _get_session() -> ClientSession:
+    """Get the shared client session, creating it on first use."""
+    if _state.session is None or _state.session.closed:
+        # Pooled connections let repeated downloads from the same host reuse
+        # TCP/TLS connections and cached DNS lookups
+        connector = TCPConnector(
+            limit=32, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=75
+        )
+        timeout = ClientTimeout(total=None, connect=30, sock_connect=30, sock_read=30)
+        _state.session = ClientSession(connector=connector, timeout=timeout)
+    return _state.session
+
+
+async def close_session(app: web.Application) -> None:
+    """Close the shared client session when the server shuts down."""
+    if _state.session is not None:
+        await _state.session.close()
+        _state.session = None
 
 
 async def _prepare_download_path(download_id: str, full_path: str) -> str | None:
-    """Prepare the download path, creating directories and handling conflicts."""
-    try:
-        target_directory = os.path.dirname(full_path)
-        if not os.path.exists(target_directory):
-            os.makedirs(target_directory, exist_ok=True)
-            logger.info("Created directory: %s", target_directory)
-
-        # Handle existing file conflicts
-        if os.path.exists(full_path):
-            logger.warning("File already exists at %s. Adding timestamp.", full_path)
-            filename_parts = os.path.splitext(os.path.basename(full_path))
-            timestamped_filename = f"{filename_parts[0]}_{int(time.time())}{filename_parts[1]}"
-            full_path = os.path.join(target_directory, timestamped_filename)
+    """
+    Prepare the download directory and return the temporary path to download to.
 
-            if download_id in active_downloads:
-                active_downloads[download_id]["path"] = full_path
-                active_downloads[download_id]["filename"] = timestamped_filename
-                logger.info("Updated download path to: %s", full_path)
+    The file is written next to its destination and atomically renamed into place
+    once complete, so a partial download never shows up under the final name. The
+    temporary name is unique to this download, so concurrent downloads to the same
+    destination never share or delete each other's partial file. Partial files for
+    the same destination left behind by a killed process are removed first.
+    """
+    try:
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
     except OSError as e:
         logger.exception("Error preparing download directory")
         if download_id in active_downloads:
             active_downloads[download_id]["status"] = "error"
             active_downloads[download_id]["error"] = f"Failed to create directory: {e}"
+            active_downloads[download_id]["end_time"] = time.time()
+            _state.list_cache = None
             await send_download_update(download_id)
         return None
-    else:
-        return full_path
 
+    partial_path = f"{full_path}.{os.getpid()}.{time.time_ns()}{PARTIAL_SUFFIX}"
+    _state.partial_paths.add(partial_path)
 
-async def _fetch_content_length(
-    session: ClientSession, download_id: str, url: str
-) -> None:
-    """Fetch content length via HEAD request."""
+    # Deleting a multi-GB leftover can take a while, so keep it off the event loop
+    await asyncio.get_running_loop().run_in_executor(None, _remove_stale_partials, full_path)
+    return partial_path
+
+
+def _remove_stale_partials(full_path: str) -> None:
+    """Delete partial files for full_path whose owning download is no longer running."""
+    directory, name = os.path.split(full_path)
+    prefix = name + "."
     try:
-        async with session.head(url, allow_redirects=True) as head_response:
-            if head_response.status == HTTPStatus.OK:
-                content_length = head_response.headers.get("content-length")
-                if content_length:
-                    total_size = int(content_length)
-                    content_type = head_response.headers.get("content-type", "")
-                    size_mb = total_size / (1024 * 1024)
-                    logger.info("File size from HEAD: %d bytes (%.2f MB)", total_size, size_mb)
-
-                    if download_id in active_downloads:
-                        active_downloads[download_id]["total_size"] = total_size
-                        active_downloads[download_id]["content_type"] = content_type
+        with os.scandir(directory) as entries:
+            candidates = [
+                entry.name
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(PARTIAL_SUFFIX)
+            ]
+    except OSError:
+        return
+
+    current_pid = os.getpid()
+    for candidate in candidates:
+        # Partial names are <name>.<pid>.<time_ns>.partial
+        owner, _, stamp = candidate[len(prefix) : -len(PARTIAL_SUFFIX)].partition(".")
+        if not (owner.isdigit() and stamp.isdigit()):
+            continue
+
+        path = os.path.join(directory, candidate)
+        owner_pid = int(owner)
+        if owner_pid == current_pid:
+            # Either a live download here, or a previous run that had the same PID
+            # (e.g. PID 1 in a container)
+            stale = path not in _state.partial_paths
+        else:
+            stale = not _pid_alive(owner_pid)
+
+        if stale:
+            try:
+                os.unlink(path)
+            except OSError:
+                logger.warning("Could not remove stale partial download %s", path)
             else:
-                logger.warning("HEAD request returned status %d", head_response.status)
-    except (OSError, TimeoutError) as e:
-        logger.warning("HEAD request failed: %s", e)
+                logger.info("Removed stale partial download %s", path)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process with the given PID exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user
+        return True
+    return True
 
 
 async def _download_with_progress(
-    session: ClientSession, download_id: str, url: str, full_path: str
+    download_id: str, url: str, partial_path: str, full_path: str, resume_from: int = 0
 ) -> None:
-    """Download file with progress tracking."""
-    async with session.get(url, allow_redirects=True) as response:
-        if response.status != HTTPStatus.OK:
+    """
+    Download file to partial_path with progress tracking, then move it to full_path.
+
+    With a non-zero resume_from, the first resume_from bytes of partial_path are kept
+    and only the rest of the file is requested. Servers that ignore the Range header
+    send the whole file, and the download starts over.
+    """
+    block_size = _transfer_block_size(full_path)
+
+    headers = {"Range": f"bytes={resume_from}-"} if resume_from else None
+
+    async with _get_session().get(
+        url, allow_redirects=True, read_bufsize=block_size, headers=headers
+    ) as response:
+        if response.status == HTTPStatus.PARTIAL_CONTENT and resume_from:
+            range_start = _content_range_start(response)
+            if range_start != resume_from:
+                raise OSError(f"Server resumed at byte {range_start}, expected {resume_from}")
+            logger.info(
+                "[%s] Resuming download at %.2f MB", download_id, resume_from / (1024 * 1024)
+            )
+        elif response.status == HTTPStatus.OK:
+            resume_from = 0
+        else:
             raise OSError(f"HTTP error {response.status}: {response.reason}")
 
-        # Get or update file size
+        # Get file size from the response headers and let clients know it up front
         total_size = _get_or_update_total_size(download_id, response)
+        await send_download_update(download_id)
 
         logger.info("Starting download of %.2f MB file", total_size / (1024 * 1024))
 
-        downloaded = 0
-        update_interval = 1.0
-        last_update_time = 0.0
-        percent_logged = -1
+        # Look up this download's records once instead of on every sample
+        download = active_downloads.get(download_id)
+        counters = active_counters.get(download_id)
+
+        downloaded = resume_from
+        percent_logged = 0
         filename = os.path.basename(full_path)
-        start_time = time.time()
+        start_time = time.monotonic()
+        last_sample_time = start_time
 
         logger.info("[%s] Beginning data transfer for %s", download_id, filename)
 
-        with open(full_path, "wb") as f:
-            async for chunk in response.content.iter_chunked(1024 * 1024):
-                if not chunk:
-                    break
+        loop = asyncio.get_running_loop()
 
-                f.write(chunk)
-                downloaded += len(chunk)
-
-                _update_download_progress(
-                    download_id, downloaded, total_size, start_time
-                )
-
-                # Log at 10% increments
-                if download_id in active_downloads:
-                    current_percent = active_downloads[download_id].get("percent", 0)
-                    if (
-                        current_percent > 0
-                        and current_percent % 10 == 0
-                        and current_percent != percent_logged
-                    ):
-                        percent_logged = current_percent
-                        _log_progress(download_id, downloaded, total_size)
-
-                    # Throttled WebSocket updates
-                    current_time = time.time()
-                    if current_time - last_update_time >= update_interval:
-                        last_update_time = current_time
-                        await send_download_update(download_id)
+        # Disk I/O runs on a dedicated thread so a slow disk can't stall the event loop.
+        # The executor is shut down before the file is closed.
+        with (
+            open(partial_path, "r+b" if resume_from else "wb") as f,
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="model_download") as writer,
+        ):
+            f.seek(resume_from)
+            pending_write: asyncio.Future[int] | None = None
+            try:
+                await loop.run_in_executor(writer, _preallocate, f.fileno(), total_size)
+
+                # Keep one write in flight while the next chunk is received
+                async for chunk in response.content.iter_chunked(block_size):
+                    if not chunk:
+                        break
+
+                    if pending_write is not None:
+                        await pending_write
+                    pending_write = loop.run_in_executor(writer, f.write, chunk)
+                    downloaded += len(chunk)
+
+                    # Only sample progress a few times per second, not per chunk
+                    now = time.monotonic()
+                    if now - last_sample_time < PROGRESS_SAMPLE_INTERVAL:
+                        continue
+                    last_sample_time = now
+
+                    if counters is not None:
+                        _update_download_progress(
+                            counters, downloaded, total_size, start_time, resume_from
+                        )
+
+                        # Log at 10% increments
+                        current_percent = counters.percent
+                        if current_percent >= percent_logged + 10:
+                            percent_logged = current_percent - current_percent % 10
+                            _log_progress(download_id, counters, total_size)
+
+                if pending_write is not None:
+                    await pending_write
+            finally:
+                # Wait for the last write without letting its error mask the one being
+                # raised, then drop preallocated space that wasn't written, so the
+                # partial file only ever holds received bytes and can be resumed
+                if pending_write is not None:
+                    with contextlib.suppress(Exception):
+                        await pending_write
+                await loop.run_in_executor(writer, f.truncate)
+
+        os.replace(partial_path, full_path)
 
         # Mark download as completed
-        _finalize_download(download_id, downloaded, total_size, full_path)
+        if download is not None and counters is not None:
+            _finalize_download(download, counters, downloaded, total_size, full_path)
         await send_download_update(download_id)
 
 
+def _partial_size(partial_path: str) -> int:
+    """Get the size of a partial download written by an earlier attempt, or 0."""
+    try:
+        return os.path.getsize(partial_path)
+    except OSError:
+        return 0
+
+
+def _content_range_start(response: ClientResponse) -> int | None:
+    """Get the first byte offset from a response's Content-Range header."""
+    content_range = response.headers.get("content-range", "")
+    start = content_range.removeprefix("bytes ").partition("-")[0]
+    return int(start) if start.isdigit() else None
+
+
+def _transfer_block_size(full_path: str) -> int:
+    """Pick a read/write block size suited to the destination filesystem."""
+    try:
+        fs_block_size = os.statvfs(os.path.dirname(full_path)).f_bsize
+    except OSError:
+        fs_block_size = 1024 * 1024
+    return min(max(fs_block_size, MIN_TRANSFER_BLOCK), MAX_TRANSFER_BLOCK)
+
+
+def _preallocate(fd: int, total_size: int) -> None:
+    """Reserve disk space up front so the file isn't extended chunk by chunk."""
+    if total_size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, total_size)
+    except OSError as e:
+        logger.debug("Preallocation not supported for this file: %s", e)
+
+
+def _ensure_broadcaster() -> None:
+    """Start the progress broadcaster if it isn't already running."""
+    if _state.broadcaster is None or _state.broadcaster.done():
+        _state.broadcaster = PromptServer.instance.loop.create_task(_progress_broadcaster())
+
+
+async def _progress_broadcaster() -> None:
+    """
+    Periodically send one batched progress update for all running downloads.
+
+    Runs while there are downloads being tracked, so N concurrent downloads cost
+    one WebSocket message per interval instead of N. Also forgets finished
+    downloads once FINISHED_DOWNLOAD_TTL has passed.
+    """
+    while active_downloads:
+        await asyncio.sleep(PROGRESS_BROADCAST_INTERVAL)
+        _sweep_finished_downloads()
+
+        downloads = {
+            download_id: _progress_payload(download_id)
+            for download_id, download in active_downloads.items()
+            if download["status"] == "downloading"
+        }
+        if not downloads:
+            continue
+
+        try:
+            PromptServer.instance.send_sync("model_downloads_progress", {"downloads": downloads})
+        except (OSError, RuntimeError):
+            logger.exception("WebSocket error")
+
+
 def _get_or_update_total_size(download_id: str, response: ClientResponse) -> int:
     """Get total size from download info or response headers."""
-    total_size = 0
-    if download_id in active_downloads:
-        total_size = active_downloads[download_id].get("total_size", 0)
+    counters = active_counters.get(download_id)
+    total_size = counters.total_size if counters is not None else 0
 
     if total_size == 0:
         content_length = response.headers.get("content-length")
-        if content_length:
+        if response.status == HTTPStatus.PARTIAL_CONTENT:
+            # Content-Length only covers the remainder of a resumed download
+            content_length = response.headers.get("content-range", "").rpartition("/")[2]
+        if content_length and content_length.isdigit():
             total_size = int(content_length)
+            if counters is not None:
+                counters.total_size = total_size
+                _state.list_cache = None
             if download_id in active_downloads:
-                active_downloads[download_id]["total_size"] = total_size
                 active_downloads[download_id]["content_type"] = response.headers.get(
                     "content-type", ""
                 )
@@ -353,39 +621,41 @@ def _get_or_update_total_size(download_id: str, response: ClientResponse) -> int
 
 
 def _update_download_progress(
-    download_id: str, downloaded: int, total_size: int, start_time: float
+    counters: _Counters,
+    downloaded: int,
+    total_size: int,
+    start_time: float,
+    resumed_from: int = 0,
 ) -> None:
-    """Update download progress information."""
-    if download_id not in active_downloads:
+    """Update download progress information (start_time is a monotonic timestamp)."""
+    # Nothing arrived since the last sample, so every derived value is unchanged
+    if downloaded == counters.downloaded:
         return
 
-    active_downloads[download_id]["downloaded"] = downloaded
+    _state.list_cache = None
+    counters.downloaded = downloaded
 
     if total_size > 0:
-        current_percent = int((downloaded / total_size) * 100)
-        active_downloads[download_id]["percent"] = current_percent
+        counters.percent = downloaded * 100 // total_size
 
-    time_elapsed = time.time() - start_time
-    if downloaded > 0 and time_elapsed > 0:
-        speed_mbps = downloaded / (1024 * 1024) / time_elapsed
-        active_downloads[download_id]["speed"] = round(speed_mbps, 2)
+    # Speed only counts bytes received since start_time, not resumed ones
+    time_elapsed = time.monotonic() - start_time
+    transferred = downloaded - resumed_from
+    if transferred > 0 and time_elapsed > 0:
+        bytes_per_second = transferred / time_elapsed
+        counters.speed = round(bytes_per_second * MB_PER_BYTE, 2)
 
-        if total_size > 0 and speed_mbps > 0:
-            bytes_remaining = total_size - downloaded
-            seconds_remaining = bytes_remaining / (speed_mbps * 1024 * 1024)
-            active_downloads[download_id]["eta"] = int(seconds_remaining)
+        if total_size > 0:
+            counters.eta = int((total_size - downloaded) / bytes_per_second)
 
 
-def _log_progress(download_id: str, downloaded: int, total_size: int) -> None:
+def _log_progress(download_id: str, counters: _Counters, total_size: int) -> None:
     """Log download progress at intervals."""
-    if download_id not in active_downloads:
-        return
-
-    speed = active_downloads[download_id].get("speed", 0)
-    eta = active_downloads[download_id].get("eta", 0)
-    percent = active_downloads[download_id].get("percent", 0)
+    speed = counters.speed
+    eta = counters.eta
+    percent = counters.percent
     eta_str = f", ETA: {eta // 60}m {eta % 60}s" if eta else ""
-    dl_mb = downloaded / (1024 * 1024)
+    dl_mb = counters.downloaded / (1024 * 1024)
     total_mb = total_size / (1024 * 1024)
 
     logger.info(
@@ -400,13 +670,15 @@ def _log_progress(download_id: str, downloaded: int, total_size: int) -> None:
 
 
 def _finalize_download(
-    download_id: str, downloaded: int, total_size: int, full_path: str
+    download: DownloadData,
+    counters: _Counters,
+    downloaded: int,
+    total_size: int,
+    full_path: str,
 ) -> None:
     """Finalize download and log completion."""
-    if download_id not in active_downloads:
-        return
-
-    elapsed_time = time.time() - active_downloads[download_id].get("start_time", time.time())
+    download_id = download["download_id"]
+    elapsed_time = time.time() - download.get("start_time", time.time())
     download_speed = (downloaded / elapsed_time) / (1024 * 1024) if elapsed_time > 0 else 0
 
     dl_size_mb = downloaded / (1024 * 1024)
@@ -418,40 +690,73 @@ def _finalize_download(
         download_speed,
     )
 
-    active_downloads[download_id]["status"] = "completed"
-    active_downloads[download_id]["end_time"] = time.time()
-    active_downloads[download_id]["downloaded"] = downloaded
-    active_downloads[download_id]["percent"] = 100 if total_size > 0 else 0
+    download["status"] = "completed"
+    download["end_time"] = time.time()
+    _state.list_cache = None
+
+    counters.downloaded = downloaded
+    counters.percent = 100 if total_size > 0 else 0
+    counters.speed = round(download_speed, 2)
+    counters.eta = 0
 
     logger.info("[%s] Model downloaded successfully to %s", download_id, full_path)
 
 
+def _download_snapshot(download_id: str) -> DownloadData:
+    """Build the full download info for a download, merging in its counters."""
+    download = dict(active_downloads[download_id])
+    counters = active_counters.get(download_id)
+    if counters is not None:
+        download["downloaded"] = counters.downloaded
+        download["total_size"] = counters.total_size
+        download["percent"] = counters.percent
+        download["speed"] = counters.speed
+        download["eta"] = counters.eta
+    return download
+
+
+def _sweep_finished_downloads() -> None:
+    """Remove completed and failed downloads that finished over FINISHED_DOWNLOAD_TTL ago."""
+    cutoff = time.time() - FINISHED_DOWNLOAD_TTL
+    for download_id, download in list(active_downloads.items()):
+        if (
+            download["status"] != "downloading"
+            and download.get("end_time", download["start_time"]) < cutoff
+        ):
+            del active_downloads[download_id]
+            active_counters.pop(download_id, None)
+            _state.list_cache = None
+
+
+def _progress_payload(download_id: str) -> dict[str, Any]:
+    """Build the WebSocket progress message for a download."""
+    download = _download_snapshot(download_id)
+    return {
+        "download_id": download_id,
+        "status": download["status"],
+        "percent": download.get("percent", 0),
+        "downloaded": download.get("downloaded", 0),
+        "total_size": download.get("total_size", 0),
+        "speed": download.get("speed", 0),
+        "eta": download.get("eta", 0),
+        "error": download.get("error"),
+    }
+
+
 async def send_download_update(download_id: str) -> None:
     """Send a WebSocket update to all clients about download status."""
     if download_id not in active_downloads:
         return
 
-    download = active_downloads[download_id]
+    payload = _progress_payload(download_id)
 
-    if download["status"] == "completed":
-        logger.info("Download complete: %s", download.get("filename", ""))
-    elif download["status"] == "error":
-        logger.info("Download error: %s", download.get("error", ""))
+    if payload["status"] == "completed":
+        logger.info("Download complete: %s", active_downloads[download_id].get("filename", ""))
+    elif payload["status"] == "error":
+        logger.info("Download error: %s", payload["error"] or "")
 
     try:
-        PromptServer.instance.send_sync(
-            "model_download_progress",
-            {
-                "download_id": download_id,
-                "status": download["status"],
-                "percent": download.get("percent", 0),
-                "downloaded": download.get("downloaded", 0),
-                "total_size": download.get("total_size", 0),
-                "speed": download.get("speed", 0),
-                "eta": download.get("eta", 0),
-                "error": download.get("error"),
-            },
-        )
+        PromptServer.instance.send_sync("model_download_progress", payload)
     except (OSError, RuntimeError):
         logger.exception("WebSocket error")
 
@@ -462,18 +767,27 @@ async def get_download_progress(request: web.Request) -> web.Response:
         download_id = request.match_info.get("download_id")
 
         if download_id and download_id in active_downloads:
-            return web.json_response({"success": True, "download": active_downloads[download_id]})
-        return web.json_response({"success": False, "error": "Download not found"})
+            return _json_response({"success": True, "download": _download_snapshot(download_id)})
+        return _json_response({"success": False, "error": "Download not found"})
     except (KeyError, TypeError) as e:
-        return web.json_response({"success": False, "error": str(e)})
+        return _json_response({"success": False, "error": str(e)})
 
 
 async def list_downloads(request: web.Request) -> web.Response:
     """List all active downloads."""
     try:
-        return web.json_response({"success": True, "downloads": active_downloads})
+        # Reuse the serialized list while it is fresh and no download has changed
+        cached = _state.list_cache
+        now = time.monotonic()
+        if cached is None or now - cached[0] >= LIST_CACHE_TTL:
+            downloads = {
+                download_id: _download_snapshot(download_id) for download_id in active_downloads
+            }
+            body = _dumps({"success": True, "downloads": downloads})
+            cached = _state.list_cache = (now, body)
+        return web.Response(body=cached[1], content_type="application/json")
     except (TypeError, ValueError) as e:
-        return web.json_response({"success": False, "error": str(e)})
+        return _json_response({"success": False, "error": str(e)})
 
 
 def setup_js_api(app: Any, *args: Any, **kwargs: Any) -> Any:
@@ -5,8 +5,8 @@ from __future__ import annotations
 
 import logging
 import os
+import runpy
 import sys
-from typing import NoReturn
 
 # Configure logging
 logging.basicConfig(
@@ -37,18 +37,14 @@ def get_persistent_dir() -> str:
 
 def setup_command_line_args(persistent_dir: str) -> None:
     """Configure command line arguments for persistence."""
-    # Force the base directory in command line arguments
-    if "--base-directory" not in sys.argv:
-        sys.argv.append("--base-directory")
-        sys.argv.append(persistent_dir)
+    # Force the base directory in command line arguments, replacing any given value
+    try:
+        index = sys.argv.index("--base-directory")
+    except ValueError:
+        sys.argv.extend(("--base-directory", persistent_dir))
     else:
-        # Find the index and replace its value
-        try:
-            index = sys.argv.index("--base-directory")
-            if index + 1 < len(sys.argv):
-                sys.argv[index + 1] = persistent_dir
-        except ValueError:
-            pass
+        if index + 1 < len(sys.argv):
+            sys.argv[index + 1] = persistent_dir
 
     # Ensure the --persistent flag is set (filtered out before execution)
     if "--persistent" not in sys.argv:
@@ -67,7 +63,21 @@ def ensure_utils_package(app_dir: str) -> None:
             logger.warning("Could not create utils __init__.py")
 
 
-def run_comfyui() -> NoReturn:
+def forget_app_modules() -> None:
+    """Drop ComfyUI modules imported during persistence setup.
+
+    ComfyUI's folder_paths imports comfy.cli_args, which parses the command line once
+    at import time, and only if comfy.options.enable_args_parsing() was called first.
+    A copy imported while setting up persistence therefore holds default arguments,
+    and main.py would silently reuse it. Dropping these modules makes main.py import
+    them fresh, as it would in a new interpreter.
+    """
+    for name in list(sys.modules):
+        if name in ("folder_paths", "comfy") or name.startswith("comfy."):
+            del sys.modules[name]
+
+
+def run_comfyui() -> None:
     """Run the ComfyUI main.py with persistence enabled."""
     # Initialize persistence
     persistent_dir = get_persistent_dir()
@@ -101,14 +111,22 @@ def run_comfyui() -> NoReturn:
     # Ensure utils package exists
     ensure_utils_package(app_dir)
 
-    # Build command, filtering out --persistent which main.py doesn't recognize
+    # Rewrite arguments, filtering out --persistent which main.py doesn't recognize
     filtered_args = [arg for arg in sys.argv[1:] if arg != "--persistent"]
-    cmd = [sys.executable, original_main, *filtered_args]
+    sys.argv[:] = [original_main, *filtered_args]
+
+    logger.info("Running main.py with arguments: %s", filtered_args)
+
+    # Hand the root logger back so ComfyUI's own logging setup isn't duplicated
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
 
-    logger.info("Running command: %s", " ".join(cmd))
+    # main.py must import ComfyUI's modules itself, after sys.argv is final
+    forget_app_modules()
 
-    # Execute and replace current process
-    os.execve(sys.executable, cmd, os.environ)
+    # Run in this interpreter rather than re-executing, so startup happens only once
+    runpy.run_path(original_main, run_name="__main__")
 
 
 if __name__ == "__main__":
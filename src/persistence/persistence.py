@@ -8,11 +8,20 @@ This script ensures models and other user data persist across runs.
 
 from __future__ import annotations
 
+import contextlib
+import errno
+import functools
+import importlib
+import json
 import logging
 import os
 import shutil
+import stat
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +29,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger("persistence")
 
+# Persistent directory from the environment, resolved once at import
+_ENV_BASE_DIR = os.environ.get(
+    "COMFY_USER_DIR", os.path.join(os.path.expanduser("~"), ".config", "comfy-ui")
+)
+
+# Attribute set on folder_paths once it has been patched
+_PATCHED_MARKER = "_comfyui_nix_patched"
+
+# File in the base directory recording the last completed link setup
+SNAPSHOT_FILE = ".persistence_cache"
+
 
 class _PersistenceState:
     """Module-level state holder for persistence configuration."""
@@ -27,6 +47,8 @@ class _PersistenceState:
     def __init__(self) -> None:
         self.initialized: bool = False
         self.base_dir: str | None = None
+        self.created_dirs: set[str] = set()
+        self.patched_downloader: bool = False
 
 
 # Single instance for module state
@@ -34,41 +56,57 @@ _state = _PersistenceState()
 
 
 def ensure_dir(path: str | Path) -> None:
-    """Ensure a directory exists."""
+    """Ensure a directory exists, skipping paths already created by this process."""
+    path = os.fspath(path)
+    if path in _state.created_dirs:
+        return
     os.makedirs(path, exist_ok=True)
+    _state.created_dirs.add(path)
 
 
 def create_symlink(source: str | Path, target: str | Path) -> None:
     """Create a symlink, removing target first if it exists."""
-    target_path = Path(target)
-    source_path = Path(source)
+    # A single lstat answers both existence and type without following links
+    try:
+        target_mode = os.lstat(target).st_mode
+    except FileNotFoundError:
+        target_mode = None
 
-    if target_path.exists() or target_path.is_symlink():
-        if target_path.is_dir() and not target_path.is_symlink():
-            shutil.rmtree(target_path)
+    if target_mode is not None:
+        if stat.S_ISDIR(target_mode):
+            shutil.rmtree(target)
         else:
-            target_path.unlink()
+            os.unlink(target)
 
     # Create parent dirs if needed
-    target_path.parent.mkdir(parents=True, exist_ok=True)
+    parent_dir = os.path.dirname(target)
+    if parent_dir:
+        ensure_dir(parent_dir)
 
     # Create the symlink
-    os.symlink(source_path, target_path, target_is_directory=source_path.is_dir())
+    os.symlink(source, target, target_is_directory=os.path.isdir(source))
     logger.info("Created symlink: %s -> %s", source, target)
 
 
 def patch_model_downloader() -> None:
     """Minimal patch for model_downloader to ensure it works with our folder paths."""
+    if _state.patched_downloader:
+        return
+
     try:
         # Ensure the model_downloader_patch.py is properly loaded
         app_dir = os.environ.get("COMFY_APP_DIR")
         if app_dir:
             patch_file = os.path.join(app_dir, "model_downloader_patch.py")
-            if not os.path.exists(patch_file):
+            if not os.path.lexists(patch_file):
                 custom_node_patch = os.path.join(
                     app_dir, "custom_nodes", "model_downloader", "model_downloader_patch.py"
                 )
-                if os.path.exists(custom_node_patch):
+                try:
+                    os.stat(custom_node_patch)
+                except FileNotFoundError:
+                    logger.debug("No model downloader patch found at %s", custom_node_patch)
+                else:
                     try:
                         os.symlink(custom_node_patch, patch_file)
                         logger.info(
@@ -85,6 +123,7 @@ def patch_model_downloader() -> None:
                         )
 
         logger.info("Model downloader will use patched folder paths")
+        _state.patched_downloader = True
     except OSError:
         logger.exception("Error preparing model downloader")
 
@@ -92,18 +131,39 @@ def patch_model_downloader() -> None:
 def patch_folder_paths(base_dir: str) -> None:
     """Patch the folder_paths module to use our persistent directories."""
     try:
-        import folder_paths  # type: ignore[import-not-found]
+        # Reuse the already-imported module instead of going through the import system.
+        # Importing it here parses ComfyUI's arguments early, so persistent_main.py
+        # drops it again before running main.py (see forget_app_modules there).
+        folder_paths = sys.modules.get("folder_paths") or importlib.import_module("folder_paths")
+
+        # Patching twice would wrap the patched lookup around itself
+        if getattr(folder_paths, _PATCHED_MARKER, False):
+            logger.debug("folder_paths already patched, skipping")
+            return
 
         # Store the original get_folder_paths function
         original_get_folder_paths = folder_paths.get_folder_paths
 
+        # Persistent model folders, scanned once up front; misses are re-checked
+        # since downloads may create a folder after patching
+        models_dir = os.path.join(base_dir, "models")
+        persistent_folders: dict[str, str] = {}
+        with contextlib.suppress(FileNotFoundError), os.scandir(models_dir) as entries:
+            persistent_folders.update(
+                (entry.name, entry.path) for entry in entries if entry.is_dir()
+            )
+
         def patched_get_folder_paths(folder_name: str) -> tuple[list[str], list[str]]:
             """Get folder paths with persistent directory override."""
             original_paths = original_get_folder_paths(folder_name)
-            persistent_path = os.path.join(base_dir, "models", folder_name)
-
-            if os.path.exists(persistent_path):
-                logger.info("Using persistent path for %s: %s", folder_name, persistent_path)
+            persistent_path = persistent_folders.get(folder_name)
+            if persistent_path is None:
+                candidate = os.path.join(models_dir, folder_name)
+                if os.path.isdir(candidate):
+                    persistent_path = persistent_folders[folder_name] = candidate
+
+            if persistent_path is not None:
+                logger.debug("Using persistent path for %s: %s", folder_name, persistent_path)
                 if len(original_paths) > 1:
                     return ([persistent_path], original_paths[1])
                 return ([persistent_path], [])
@@ -123,25 +183,29 @@ def patch_folder_paths(base_dir: str) -> None:
         folder_paths.get_first_folder_path = get_first_folder_path
         folder_paths.get_folder_paths = patched_get_folder_paths
 
+        # One scan of base_dir answers which of the data directories exist
+        base_entries = _scan_dir(base_dir)
+
         # Set output and input directories
         output_dir = os.path.join(base_dir, "output")
-        if os.path.exists(output_dir):
+        if "output" in base_entries:
             logger.info("Setting output directory to: %s", output_dir)
             folder_paths.set_output_directory(output_dir)
 
         input_dir = os.path.join(base_dir, "input")
-        if os.path.exists(input_dir):
+        if "input" in base_entries:
             logger.info("Setting input directory to: %s", input_dir)
             folder_paths.set_input_directory(input_dir)
 
         # Set the temp directory
         temp_dir = os.path.join(base_dir, "temp")
-        os.makedirs(temp_dir, exist_ok=True)
+        if "temp" not in base_entries:
+            ensure_dir(temp_dir)
         folder_paths.set_temp_directory(temp_dir)
 
         # Set user directory
         user_dir = os.path.join(base_dir, "user")
-        if os.path.exists(user_dir):
+        if "user" in base_entries:
             logger.info("Setting user directory to: %s", user_dir)
             folder_paths.set_user_directory(user_dir)
 
@@ -151,6 +215,7 @@ def patch_folder_paths(base_dir: str) -> None:
         folder_paths.temp_directory = temp_dir
         folder_paths.user_directory = user_dir
 
+        setattr(folder_paths, _PATCHED_MARKER, True)
         logger.info("Path patching complete")
     except ImportError:
         logger.warning("Could not import folder_paths module, skipping patching")
@@ -158,31 +223,61 @@ def patch_folder_paths(base_dir: str) -> None:
         logger.exception("Error patching folder_paths - missing expected attributes")
 
 
-def _migrate_existing_data(src_path: Path, dst_path: Path) -> None:
+def _migrate_existing_data(src_path: str, dst_path: str) -> None:
     """Migrate existing data from source to destination if needed."""
-    if not src_path.is_dir() or not os.listdir(src_path):
+    if not os.path.isdir(src_path):
         return
 
-    for item in os.listdir(src_path):
-        src = src_path / item
-        dst = dst_path / item
-        if not dst.exists():
-            if src.is_dir():
-                shutil.copytree(src, dst)
+    # One scandir pass; DirEntry caches the type, so no extra stat per entry
+    with os.scandir(src_path) as entries:
+        for entry in entries:
+            dst = os.path.join(dst_path, entry.name)
+            if os.path.lexists(dst):
+                continue
+
+            # The source is removed afterwards, so move rather than copy when possible
+            try:
+                os.rename(entry.path, dst)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
             else:
-                shutil.copy2(src, dst)
+                continue
 
+            if entry.is_dir(follow_symlinks=False):
+                shutil.copytree(entry.path, dst, symlinks=True)
+            else:
+                shutil.copy2(entry.path, dst, follow_symlinks=False)
 
-def _create_directory_symlink(
-    persistent_path: Path, app_path: Path, dir_name: str
-) -> None:
-    """Create a symlink from app_path to persistent_path."""
+
+def _scan_dir(path: str) -> dict[str, os.DirEntry[str]]:
+    """Map entry names to DirEntry objects for a directory, empty if it is missing."""
     try:
-        persistent_path.mkdir(parents=True, exist_ok=True)
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except FileNotFoundError:
+        return {}
 
-        if app_path.exists() or app_path.is_symlink():
-            if app_path.is_symlink():
-                app_path.unlink()
+
+def _create_directory_symlink(
+    persistent_path: str, app_path: str, dir_name: str, app_entry: os.DirEntry[str] | None
+) -> bool:
+    """Create a symlink from app_path to persistent_path, returning whether it is in place.
+
+    app_entry is app_path's entry from a scan of its parent, or None if it was absent.
+    """
+    try:
+        # Parents are created up front by setup_persistence
+        with contextlib.suppress(FileExistsError):
+            os.mkdir(persistent_path)
+
+        if app_entry is not None:
+            if app_entry.is_symlink():
+                # Leave a link that already points at the persistent directory alone
+                if os.readlink(app_path) == persistent_path:
+                    logger.debug("Symlink already in place: %s -> %s", persistent_path, app_path)
+                    return True
+                os.unlink(app_path)
             else:
                 _migrate_existing_data(app_path, persistent_path)
                 shutil.rmtree(app_path)
@@ -193,6 +288,43 @@ def _create_directory_symlink(
         logger.exception("Permission denied creating symlink for %s", dir_name)
     except OSError:
         logger.exception("Error creating symlink for %s", dir_name)
+    else:
+        return True
+    return False
+
+
+def _load_snapshot(base_dir: str) -> Any:
+    """Load the setup snapshot written by a previous run, if any."""
+    try:
+        with open(os.path.join(base_dir, SNAPSHOT_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_snapshot(base_dir: str, snapshot: dict[str, Any]) -> None:
+    """Record a completed setup so the next run can skip relinking."""
+    try:
+        with open(os.path.join(base_dir, SNAPSHOT_FILE), "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+    except OSError:
+        logger.warning("Could not write persistence snapshot to %s", base_dir)
+
+
+def _restore_persistent_dirs(links: list[tuple[str, str, str, str]]) -> bool:
+    """Recreate persistent directories missing behind existing links.
+
+    Returns False if a parent directory is gone too, so the full setup has to run.
+    """
+    for name, persistent_path, _, _ in links:
+        try:
+            os.mkdir(persistent_path)
+        except FileExistsError:
+            continue
+        except OSError:
+            return False
+        logger.info("Recreated missing persistent directory for %s: %s", name, persistent_path)
+    return True
 
 
 def setup_persistence() -> str:
@@ -208,9 +340,7 @@ def setup_persistence() -> str:
         return _state.base_dir
 
     # Create the persistent directory if it doesn't exist
-    base_dir = os.environ.get(
-        "COMFY_USER_DIR", os.path.join(os.path.expanduser("~"), ".config", "comfy-ui")
-    )
+    base_dir = _ENV_BASE_DIR
     logger.info("Using persistent directory: %s", base_dir)
 
     # Get ComfyUI path
@@ -248,21 +378,45 @@ def setup_persistence() -> str:
     # User data directories
     user_dirs = ["output", "input", "user", "temp"]
 
-    # Create base directories
-    os.makedirs(base_dir, exist_ok=True)
-    os.makedirs(os.path.join(base_dir, "models"), exist_ok=True)
-
-    # Create model symlinks
-    for model_dir in model_dirs:
-        persistent_path = Path(base_dir) / "models" / model_dir
-        app_path = Path(app_dir) / "models" / model_dir
-        _create_directory_symlink(persistent_path, app_path, model_dir)
+    # Model and user directories as (name, persistent path, app parent, app path)
+    persistent_models = os.path.join(base_dir, "models")
+    app_models = os.path.join(app_dir, "models")
+    link_groups = [
+        (persistent_models, app_models, model_dirs),
+        (base_dir, app_dir, user_dirs),
+    ]
+    links = [
+        (name, os.path.join(persistent_parent, name), app_parent, os.path.join(app_parent, name))
+        for persistent_parent, app_parent, names in link_groups
+        for name in names
+    ]
 
-    # Create user directory symlinks
-    for user_dir in user_dirs:
-        persistent_path = Path(base_dir) / user_dir
-        app_path = Path(app_dir) / user_dir
-        _create_directory_symlink(persistent_path, app_path, user_dir)
+    # Skip linking when the last run set up the same layout and its links survived.
+    # The link targets are still re-created if they were deleted since.
+    snapshot = {"base_dir": base_dir, "app_dir": app_dir, "links": [link[0] for link in links]}
+    if (
+        _load_snapshot(base_dir) == snapshot
+        and os.path.islink(links[0][3])
+        and _restore_persistent_dirs(links)
+    ):
+        logger.info("Persistent directory links unchanged since last run")
+    else:
+        # Create the parent directories once, before linking their children
+        for parent_dir in (base_dir, persistent_models, app_models):
+            ensure_dir(parent_dir)
+
+        # One scan per app parent; the cached entries replace an lstat per link
+        app_entries = {app_parent: _scan_dir(app_parent) for _, app_parent, _ in link_groups}
+
+        # Create directory symlinks, remembering the layout only if all succeeded
+        linked = [
+            _create_directory_symlink(
+                persistent_path, app_path, name, app_entries[app_parent].get(name)
+            )
+            for name, persistent_path, app_parent, app_path in links
+        ]
+        if all(linked):
+            _save_snapshot(base_dir, snapshot)
 
     # Set up environment
     os.environ["COMFY_SAVE_PATH"] = os.path.join(base_dir, "user")
@@ -287,6 +441,7 @@ def setup_persistence() -> str:
     return base_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_base_dir() -> str:
     """
     Get the base directory, initializing persistence if needed.